@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Render benchmark and golden-output check
+Feeds synthetic metrics to every SVG renderer, compares the output against the
+golden files in golden/ and reports render time and output size per case.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from generate_contributions import ContributionVisualizer
+from generate_contributions_simple import SimpleContributionVisualizer
+from generate_languages import LanguageStatsGenerator
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+# Fixed "today" so heatmap goldens do not change from day to day
+TODAY = date(2025, 1, 1)
+
+
+def heatmap_metrics(active_days: int, years: int = 1, seed: int = 0) -> Dict:
+    """Synthetic metrics for the heatmap with activity on random days."""
+    rng = random.Random(seed)
+    span = 365 * years
+    daily_activity = {}
+    for offset in rng.sample(range(span), min(active_days, span)):
+        date_key = (TODAY - timedelta(days=offset)).isoformat()
+        daily_activity[date_key] = rng.randint(1, 40)
+
+    points = sum(daily_activity.values())
+    return {
+        "prs_merged": points // 20,
+        "prs_opened": points // 12,
+        "prs_reviewed": points // 8,
+        "issues_opened": points // 30,
+        "issues_closed": points // 60,
+        "repos_contributed": min(active_days, 50),
+        "total_impact_score": points,
+        "daily_activity": daily_activity,
+    }
+
+
+def card_metrics(scale: int) -> Dict:
+    """Synthetic metrics for the card."""
+    metrics = {
+        "prs_merged": 3 * scale,
+        "prs_opened": 5 * scale,
+        "reviews": 8 * scale,
+        "issues": 2 * scale,
+        "repos": min(scale, 40),
+    }
+    metrics["impact_score"] = (
+        metrics["prs_merged"] * 5
+        + metrics["prs_opened"] * 3
+        + metrics["reviews"] * 2
+        + metrics["issues"] * 1
+    )
+    return metrics
+
+
+def language_stats(count: int, seed: int = 0) -> Dict[str, int]:
+    """Synthetic language byte counts, including names with known colors."""
+    rng = random.Random(seed)
+    known = ["Python", "JavaScript", "TypeScript", "Go", "Rust", "Shell", "C++"]
+    names = known[:count] + [f"Lang{i:03d}" for i in range(count - len(known))]
+    return {name: rng.randint(1_000, 5_000_000) for name in names}
+
+
+def build_cases() -> List[Tuple[str, Callable[[], str]]]:
+    """All benchmark cases as ``(name, render)`` pairs."""
+    # Renderers only use their arguments, so skip the GitHub client setup
+    heatmap = ContributionVisualizer.__new__(ContributionVisualizer)
+    card = SimpleContributionVisualizer.__new__(SimpleContributionVisualizer)
+    languages = LanguageStatsGenerator.__new__(LanguageStatsGenerator)
+
+    heatmap_inputs = {
+        "empty": heatmap_metrics(0),
+        "sparse": heatmap_metrics(20),
+        "dense": heatmap_metrics(365),
+        "multi_year": heatmap_metrics(1000, years=3),
+    }
+    language_inputs = {count: language_stats(count) for count in (0, 1, 8, 50, 500)}
+
+    cases = []
+    for label, metrics in heatmap_inputs.items():
+        cases.append(
+            (
+                f"heatmap_{label}",
+                lambda m=metrics: heatmap.generate_svg(m, today=TODAY),
+            )
+        )
+        cases.append(
+            (
+                f"heatmap_{label}_compact",
+                lambda m=metrics: heatmap.generate_svg(m, compact=True, today=TODAY),
+            )
+        )
+    for scale in (0, 1, 1000):
+        cases.append(
+            (
+                f"card_{scale}x",
+                lambda m=card_metrics(scale): card.generate_card_svg(m),
+            )
+        )
+    for count, stats in language_inputs.items():
+        cases.append(
+            (
+                f"languages_{count}",
+                lambda s=stats: languages.generate_languages_svg(s),
+            )
+        )
+    cases.append(
+        (
+            "languages_50_all",
+            lambda s=language_inputs[50]: languages.generate_languages_svg(s, 50),
+        )
+    )
+    return cases
+
+
+def time_render(render: Callable[[], str], min_seconds: float) -> float:
+    """Average seconds per render, repeating until ``min_seconds`` have passed."""
+    runs = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while runs == 0 or elapsed < min_seconds:
+        render()
+        runs += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / runs
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--update", action="store_true", help="rewrite golden files from current output"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="seconds to spend timing each case (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    mismatches = []
+
+    print(f"{'case':<28} {'bytes':>9} {'ms/render':>10} {'renders/s':>10}  golden")
+    for name, render in build_cases():
+        svg = render()
+        golden_path = os.path.join(GOLDEN_DIR, f"{name}.svg")
+
+        if args.update:
+            with open(golden_path, "w") as f:
+                f.write(svg)
+            status = "updated"
+        elif not os.path.exists(golden_path):
+            mismatches.append(name)
+            status = "MISSING"
+        else:
+            with open(golden_path) as f:
+                if f.read() == svg:
+                    status = "ok"
+                else:
+                    mismatches.append(name)
+                    status = "MISMATCH"
+
+        seconds = time_render(render, args.min_time)
+        print(
+            f"{name:<28} {len(svg.encode()):>9} {seconds * 1000:>10.3f} "
+            f"{1 / seconds:>10.0f}  {status}"
+        )
+
+    if mismatches:
+        print(f"\n❌ {len(mismatches)} case(s) differ from golden output:")
+        for name in mismatches:
+            print(f"  {name}")
+        print("Run with --update if the change is intended.")
+        sys.exit(1)
+
+    if args.update:
+        print(f"\n✅ Golden files written to {GOLDEN_DIR}")
+    else:
+        print("\n✅ All renders match golden output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Fetch checkpoints
+Saves per-repo partial results and pagination cursors to a local JSON file so
+an interrupted contribution fetch can resume where it stopped.
+"""
+
+import copy
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from repo_filters import as_utc
+
+
+def empty_repo_metrics() -> Dict:
+    """Counters collected for a single repository."""
+    return {
+        "prs_merged": 0,
+        "prs_opened": 0,
+        "prs_reviewed": 0,
+        "issues_opened": 0,
+        "issues_closed": 0,
+        "contributed": False,
+        "daily_activity": {},
+    }
+
+
+def merge_repo_metrics(metrics: Dict, repo_name: str, repo_metrics: Dict):
+    """Add one repository's counters to the run-wide metrics dict."""
+    for key in (
+        "prs_merged",
+        "prs_opened",
+        "prs_reviewed",
+        "issues_opened",
+        "issues_closed",
+    ):
+        metrics[key] += repo_metrics[key]
+    if repo_metrics["contributed"]:
+        metrics["repos_contributed"].add(repo_name)
+    for date_key, points in repo_metrics["daily_activity"].items():
+        metrics["daily_activity"][date_key] = (
+            metrics["daily_activity"].get(date_key, 0) + points
+        )
+
+
+class FetchCheckpoint:
+    """Local state file for a resumable contribution fetch."""
+
+    def __init__(
+        self,
+        path: str,
+        username: str,
+        days: int,
+        since: datetime,
+        save_every: int = 5,
+        max_age_hours: float = 24,
+    ):
+        """Load ``path`` if it belongs to the same, recent run; else start fresh.
+
+        Checkpoints older than ``max_age_hours`` are discarded so that a repo
+        that keeps failing cannot pin the window and counts indefinitely.
+        """
+        self.path = path
+        self.save_every = save_every
+        self._pending = 0
+        now = datetime.now(timezone.utc)
+        self.state = {
+            "username": username,
+            "days": days,
+            "created": now.isoformat(),
+            "since": as_utc(since).isoformat(),
+            "repos": {},
+        }
+
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    saved = json.load(f)
+                created = datetime.fromisoformat(saved["created"])
+                if now - as_utc(created) > timedelta(hours=max_age_hours):
+                    print(f"Discarding checkpoint {path} older than {max_age_hours}h")
+                elif saved["username"] == username and saved["days"] == days:
+                    self.state = saved
+                    done = sum(1 for r in saved["repos"].values() if r["done"])
+                    print(f"Resuming from {path} ({done} repositories complete)")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Ignoring unreadable checkpoint {path}: {e}")
+
+    @property
+    def since(self) -> datetime:
+        """Start of the fetch window; fixed for the lifetime of the checkpoint."""
+        return as_utc(datetime.fromisoformat(self.state["since"]))
+
+    def repo_state(self, repo_name: str) -> Optional[Dict]:
+        """Saved ``done``/``stage``/``page``/``partial`` entry for a repository."""
+        return self.state["repos"].get(repo_name)
+
+    def update(self, repo_name: str, stage: str, page: int, partial: Dict):
+        """Record that ``page`` is the next page to fetch for ``stage``."""
+        self.state["repos"][repo_name] = {
+            "done": False,
+            "stage": stage,
+            "page": page,
+            "partial": copy.deepcopy(partial),
+        }
+        self._pending += 1
+        if self._pending >= self.save_every:
+            self.save()
+
+    def complete(self, repo_name: str, partial: Dict):
+        """Mark a repository as fully scanned and save immediately."""
+        self.state["repos"][repo_name] = {
+            "done": True,
+            "partial": copy.deepcopy(partial),
+        }
+        self.save()
+
+    def save(self):
+        """Write the state file atomically."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.path)
+        self._pending = 0
+
+    def finish(self, failed: int):
+        """Remove the state file, or keep it so failed repositories are retried."""
+        if failed:
+            self.save()
+            print(f"Kept {self.path} to retry {failed} failed repositories")
+        elif os.path.exists(self.path):
+            os.remove(self.path)
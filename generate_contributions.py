@@ -5,10 +5,12 @@ Generates a beautiful SVG showing real contributions weighted by impact,
 not just commit frequency.
 """
 
+import copy
+import json
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import Dict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
 
 try:
     import requests
@@ -18,18 +20,45 @@ except ImportError:
     os.system(f"{sys.executable} -m pip install PyGithub requests --quiet")
     from github import Github
 
+from checkpoint import FetchCheckpoint, empty_repo_metrics, merge_repo_metrics
+from repo_filters import plan_repos, repo_filters_from_env
+
 
 class ContributionVisualizer:
     """Generates contribution visualizations based on real GitHub activity."""
 
-    def __init__(self, github_token: str, username: str):
+    def __init__(
+        self,
+        github_token: str,
+        username: str,
+        repo_filters: Optional[Dict] = None,
+        engine: str = "pygithub",
+        checkpoint_file: Optional[str] = None,
+        checkpoint_max_age: float = 24,
+    ):
         self.github = Github(github_token)
+        self.github_token = github_token
+        self.engine = engine
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_max_age = checkpoint_max_age
         self.username = username
         self.user = self.github.get_user(username)
+        self.repo_filters = repo_filters
 
     def get_contribution_metrics(self, days: int = 365) -> Dict:
         """Fetch real contribution metrics from GitHub API."""
-        since = datetime.now() - timedelta(days=days)
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+
+        checkpoint = None
+        if self.checkpoint_file:
+            checkpoint = FetchCheckpoint(
+                self.checkpoint_file,
+                self.username,
+                days,
+                since,
+                max_age_hours=self.checkpoint_max_age,
+            )
+            since = checkpoint.since  # A resumed run keeps its original window
 
         metrics = {
             "prs_merged": 0,
@@ -48,62 +77,37 @@ class ContributionVisualizer:
         repos = list(self.user.get_repos())
         print(f"Found {len(repos)} repositories")
 
-        # Get PRs (merged and opened)
-        for repo in repos:
+        plan = plan_repos(repos, since, self.repo_filters)
+
+        if self.engine == "async":
+            from github_async import AsyncContributionFetcher
+
+            fetcher = AsyncContributionFetcher(self.github_token, self.username)
+            return fetcher.get_contribution_metrics(
+                [(repo.full_name, scan_issues) for repo, scan_issues in plan],
+                since,
+                checkpoint,
+            )
+
+        failed = 0
+        for repo, scan_issues in plan:
+            # Keyed by full_name, matching the async engine
+            saved = checkpoint.repo_state(repo.full_name) if checkpoint else None
+            if saved and saved["done"]:
+                merge_repo_metrics(metrics, repo.name, saved["partial"])
+                continue
+
+            repo_metrics = empty_repo_metrics()
             try:
-                # PRs merged (high impact)
-                prs_merged = repo.get_pulls(state="closed", sort="updated")
-                for pr in prs_merged:
-                    if pr.merged_at and pr.merged_at >= since:
-                        if pr.user.login == self.username:
-                            metrics["prs_merged"] += 1
-                            metrics["repos_contributed"].add(repo.name)
-                            date_key = pr.merged_at.date().isoformat()
-                            metrics["daily_activity"][date_key] = (
-                                metrics["daily_activity"].get(date_key, 0) + 5
-                            )  # PR merge = 5 points
-
-                # PRs opened
-                prs_opened = repo.get_pulls(state="all", sort="updated")
-                for pr in prs_opened:
-                    if pr.created_at >= since and pr.user.login == self.username:
-                        metrics["prs_opened"] += 1
-                        date_key = pr.created_at.date().isoformat()
-                        metrics["daily_activity"][date_key] = (
-                            metrics["daily_activity"].get(date_key, 0) + 3
-                        )  # PR opened = 3 points
-
-                # PRs reviewed (comments on PRs)
-                prs = repo.get_pulls(state="all", sort="updated")
-                for pr in prs:
-                    if pr.updated_at >= since:
-                        comments = pr.get_comments()
-                        for comment in comments:
-                            if (
-                                comment.user.login == self.username
-                                and comment.created_at >= since
-                            ):
-                                metrics["prs_reviewed"] += 1
-                                date_key = comment.created_at.date().isoformat()
-                                metrics["daily_activity"][date_key] = (
-                                    metrics["daily_activity"].get(date_key, 0) + 2
-                                )  # Review = 2 points
-
-                # Issues
-                issues = repo.get_issues(state="all", sort="updated")
-                for issue in issues:
-                    if issue.created_at >= since and issue.user.login == self.username:
-                        if issue.pull_request is None:  # It's an issue, not a PR
-                            metrics["issues_opened"] += 1
-                            date_key = issue.created_at.date().isoformat()
-                            metrics["daily_activity"][date_key] = (
-                                metrics["daily_activity"].get(date_key, 0) + 1
-                            )  # Issue = 1 point
-                            if issue.state == "closed":
-                                metrics["issues_closed"] += 1
+                self._scan_repo(repo, scan_issues, since, repo_metrics, checkpoint)
             except Exception as e:
                 print(f"Error processing {repo.name}: {e}")
-                continue
+                failed += 1
+            # Counts gathered before a failure are kept, as before checkpointing
+            merge_repo_metrics(metrics, repo.name, repo_metrics)
+
+        if checkpoint:
+            checkpoint.finish(failed)
 
         # Calculate total impact score
         metrics["total_impact_score"] = (
@@ -116,8 +120,160 @@ class ContributionVisualizer:
 
         return metrics
 
-    def generate_svg(self, metrics: Dict, style: str = "modern") -> str:
-        """Generate beautiful SVG visualization."""
+    def _scan_repo(
+        self,
+        repo,
+        scan_issues: bool,
+        since: datetime,
+        repo_metrics: Dict,
+        checkpoint: Optional[FetchCheckpoint] = None,
+    ):
+        """Scan one repository page by page into an empty ``repo_metrics``.
+
+        Listings are ordered by creation date, oldest first, so a saved page
+        number still points at the same items when a later run resumes.
+        """
+        order = {"sort": "created", "direction": "asc"}
+        stages = [
+            # PRs merged (high impact)
+            ("prs_merged", lambda: repo.get_pulls(state="closed", **order)),
+            # PRs opened
+            ("prs_opened", lambda: repo.get_pulls(state="all", **order)),
+            # PRs reviewed (comments on PRs)
+            ("prs_reviewed", lambda: repo.get_pulls(state="all", **order)),
+        ]
+        if scan_issues:
+            stages.append(
+                ("issues_opened", lambda: repo.get_issues(state="all", **order))
+            )
+
+        stage_names = [stage for stage, _ in stages]
+        saved = checkpoint.repo_state(repo.full_name) if checkpoint else None
+        if saved and saved["stage"] in stage_names:
+            # Count into a copy; the checkpoint only changes via update()/complete()
+            repo_metrics.update(copy.deepcopy(saved["partial"]))
+            stages = stages[stage_names.index(saved["stage"]) :]
+        else:
+            # No usable cursor (e.g. issues since disabled): scan from the start
+            saved = None
+
+        for stage, get_listing in stages:
+            page = saved["page"] if saved and stage == saved["stage"] else 0
+            listing = get_listing()
+            while True:
+                items = listing.get_page(page)
+                for item in items:
+                    self._count_item(stage, item, since, repo_metrics)
+                page += 1
+                if checkpoint:
+                    checkpoint.update(repo.full_name, stage, page, repo_metrics)
+                if len(items) < self.github.per_page:
+                    break
+
+        if checkpoint:
+            checkpoint.complete(repo.full_name, repo_metrics)
+
+    def _count_item(self, stage: str, item, since: datetime, repo_metrics: Dict):
+        """Add a single PR or issue from a scan stage to the repo's counters."""
+        daily_activity = repo_metrics["daily_activity"]
+
+        if stage == "prs_merged":
+            if item.merged_at and item.merged_at >= since:
+                if item.user.login == self.username:
+                    repo_metrics["prs_merged"] += 1
+                    repo_metrics["contributed"] = True
+                    date_key = item.merged_at.date().isoformat()
+                    daily_activity[date_key] = (
+                        daily_activity.get(date_key, 0) + 5
+                    )  # PR merge = 5 points
+
+        elif stage == "prs_opened":
+            if item.created_at >= since and item.user.login == self.username:
+                repo_metrics["prs_opened"] += 1
+                date_key = item.created_at.date().isoformat()
+                daily_activity[date_key] = (
+                    daily_activity.get(date_key, 0) + 3
+                )  # PR opened = 3 points
+
+        elif stage == "prs_reviewed":
+            if item.updated_at >= since:
+                for comment in item.get_comments():
+                    if (
+                        comment.user.login == self.username
+                        and comment.created_at >= since
+                    ):
+                        repo_metrics["prs_reviewed"] += 1
+                        date_key = comment.created_at.date().isoformat()
+                        daily_activity[date_key] = (
+                            daily_activity.get(date_key, 0) + 2
+                        )  # Review = 2 points
+
+        elif stage == "issues_opened":
+            if item.created_at >= since and item.user.login == self.username:
+                if item.pull_request is None:  # It's an issue, not a PR
+                    repo_metrics["issues_opened"] += 1
+                    date_key = item.created_at.date().isoformat()
+                    daily_activity[date_key] = (
+                        daily_activity.get(date_key, 0) + 1
+                    )  # Issue = 1 point
+                    if item.state == "closed":
+                        repo_metrics["issues_closed"] += 1
+
+    def _build_heatmap_data(
+        self, metrics: Dict, today: Optional[date] = None
+    ) -> List[Dict]:
+        """Normalize daily activity into 0-4 heatmap levels for the last 365 days."""
+        if metrics["daily_activity"]:
+            max_activity = max(metrics["daily_activity"].values())
+        else:
+            max_activity = 1
+
+        today = today or datetime.now().date()
+        heatmap_data = []
+        for i in range(365):
+            day_date = today - timedelta(days=364 - i)
+            date_key = day_date.isoformat()
+            activity = metrics["daily_activity"].get(date_key, 0)
+
+            # Normalize to 0-4 scale
+            if max_activity > 0:
+                level = min(4, int((activity / max_activity) * 4))
+            else:
+                level = 0
+
+            heatmap_data.append(
+                {"date": day_date, "activity": activity, "level": level}
+            )
+
+        return heatmap_data
+
+    def generate_sidecar(self, metrics: Dict, today: Optional[date] = None) -> Dict:
+        """Per-day heatmap data for use alongside a compact SVG."""
+        return {
+            "days": [
+                {
+                    "date": day["date"].isoformat(),
+                    "activity": day["activity"],
+                    "level": day["level"],
+                }
+                for day in self._build_heatmap_data(metrics, today)
+            ]
+        }
+
+    def generate_svg(
+        self,
+        metrics: Dict,
+        style: str = "modern",
+        compact: bool = False,
+        today: Optional[date] = None,
+    ) -> str:
+        """Generate beautiful SVG visualization.
+
+        With ``compact=True`` the heatmap is drawn as one ``<path>`` per
+        activity level instead of one ``<rect>`` per day, and the per-day
+        ``data-*`` attributes are dropped (see ``generate_sidecar``).
+        ``today`` pins the last day shown, defaulting to the current date.
+        """
 
         # Color scheme (modern, accessible)
         colors = {
@@ -134,27 +290,8 @@ class ContributionVisualizer:
             "grid_4": "#39d353",
         }
 
-        # Calculate activity levels for heatmap
-        if metrics["daily_activity"]:
-            max_activity = max(metrics["daily_activity"].values())
-        else:
-            max_activity = 1
-
         # Generate heatmap data (last 365 days)
-        today = datetime.now().date()
-        heatmap_data = []
-        for i in range(365):
-            date = today - timedelta(days=364 - i)
-            date_key = date.isoformat()
-            activity = metrics["daily_activity"].get(date_key, 0)
-
-            # Normalize to 0-4 scale
-            if max_activity > 0:
-                level = min(4, int((activity / max_activity) * 4))
-            else:
-                level = 0
-
-            heatmap_data.append({"date": date, "activity": activity, "level": level})
+        heatmap_data = self._build_heatmap_data(metrics, today)
 
         # Group by weeks (53 weeks = 371 days, we'll use 53)
         weeks = []
@@ -201,19 +338,45 @@ class ContributionVisualizer:
         start_x = 120
         start_y = 80
 
-        for week_idx, week in enumerate(weeks):
-            x = start_x + (week_idx * week_width)
+        if compact:
+            # One path per level; each cell is a closed square subpath,
+            # positioned relative to the previous cell of the same level
+            cell = f"h{cell_size}v{cell_size}h-{cell_size}z"
+            level_paths = {}
+            last_cell = {}
+            for week_idx, week in enumerate(weeks):
+                x = start_x + (week_idx * week_width)
+
+                for day_idx, day in enumerate(week):
+                    y = start_y + (day_idx * week_width)
+                    level = day["level"]
+                    if level in last_cell:
+                        last_x, last_y = last_cell[level]
+                        move = f"m{x - last_x} {y - last_y}"
+                    else:
+                        move = f"M{x} {y}"
+                    level_paths.setdefault(level, []).append(move + cell)
+                    last_cell[level] = (x, y)
+
+            for level in sorted(level_paths):
+                svg_parts.append(
+                    f'<path fill="{colors[f"grid_{level}"]}" '
+                    f'd="{"".join(level_paths[level])}"/>'
+                )
+        else:
+            for week_idx, week in enumerate(weeks):
+                x = start_x + (week_idx * week_width)
 
-            for day_idx, day in enumerate(week):
-                y = start_y + (day_idx * week_width)
+                for day_idx, day in enumerate(week):
+                    y = start_y + (day_idx * week_width)
 
-                color = colors[f'grid_{day["level"]}']
+                    color = colors[f'grid_{day["level"]}']
 
-                svg_parts.append(
-                    f'<rect x="{x}" y="{y}" width="{cell_size}" height="{cell_size}" '
-                    f'fill="{color}" rx="2" data-date="{day["date"]}" '
-                    f'data-activity="{day["activity"]}"/>'
-                )
+                    svg_parts.append(
+                        f'<rect x="{x}" y="{y}" width="{cell_size}" height="{cell_size}" '
+                        f'fill="{color}" rx="2" data-date="{day["date"]}" '
+                        f'data-activity="{day["activity"]}"/>'
+                    )
 
         # Month labels
         month_labels = []
@@ -281,6 +444,10 @@ def main():
     github_token = os.getenv("GITHUB_TOKEN")
     username = os.getenv("GITHUB_USERNAME") or os.getenv("GITHUB_ACTOR")
     output_file = os.getenv("OUTPUT_FILE", "contributions.svg")
+    # Compact mode groups heatmap cells into one path per color
+    compact = os.getenv("HEATMAP_COMPACT", "false").lower() == "true"
+    # Optional JSON file holding the per-day data dropped from compact output
+    sidecar_file = os.getenv("HEATMAP_SIDECAR")
 
     if not github_token:
         print("Error: GITHUB_TOKEN environment variable not set")
@@ -292,7 +459,21 @@ def main():
 
     print(f"Generating contribution visualization for {username}...")
 
-    visualizer = ContributionVisualizer(github_token, username)
+    repo_filters = repo_filters_from_env()
+    # "async" pages through the API concurrently over keep-alive connections
+    engine = os.getenv("FETCH_ENGINE", "pygithub")
+    # Local state file that lets an interrupted run resume where it stopped
+    checkpoint_file = os.getenv("CHECKPOINT_FILE")
+    checkpoint_max_age = float(os.getenv("CHECKPOINT_MAX_AGE_HOURS", "24"))
+
+    visualizer = ContributionVisualizer(
+        github_token,
+        username,
+        repo_filters,
+        engine,
+        checkpoint_file,
+        checkpoint_max_age,
+    )
     metrics = visualizer.get_contribution_metrics(days=365)
 
     print("\nContribution Metrics:")
@@ -303,12 +484,17 @@ def main():
     print(f"  Repos Contributed: {metrics['repos_contributed']}")
     print(f"  Total Impact Score: {metrics['total_impact_score']}")
 
-    svg = visualizer.generate_svg(metrics)
+    svg = visualizer.generate_svg(metrics, compact=compact)
 
     with open(output_file, "w") as f:
         f.write(svg)
 
     print(f"\n✅ Generated {output_file}")
+
+    if sidecar_file:
+        with open(sidecar_file, "w") as f:
+            json.dump(visualizer.generate_sidecar(metrics), f)
+        print(f"✅ Generated {sidecar_file}")
     print(
         "📊 Visualization shows impact-weighted contributions, not just commit frequency"
     )
@@ -6,8 +6,8 @@ Clean, readable card-style visualization showing impact-weighted contributions.
 
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import Dict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
 
 try:
     from github import Github
@@ -16,18 +16,29 @@ except ImportError:
     os.system(f"{sys.executable} -m pip install PyGithub --quiet")
     from github import Github
 
+from repo_filters import plan_repos, repo_filters_from_env
+
 
 class SimpleContributionVisualizer:
     """Simple, readable contribution visualization."""
 
-    def __init__(self, github_token: str, username: str):
+    def __init__(
+        self,
+        github_token: str,
+        username: str,
+        repo_filters: Optional[Dict] = None,
+        engine: str = "pygithub",
+    ):
         self.github = Github(github_token)
+        self.github_token = github_token
+        self.engine = engine
         self.username = username
         self.user = self.github.get_user(username)
+        self.repo_filters = repo_filters
 
     def get_metrics(self, days: int = 365) -> Dict:
         """Get contribution metrics."""
-        since = datetime.now() - timedelta(days=days)
+        since = datetime.now(timezone.utc) - timedelta(days=days)
 
         metrics = {
             "prs_merged": 0,
@@ -43,7 +54,25 @@ class SimpleContributionVisualizer:
         repos = list(self.user.get_repos())
         print(f"Scanning {len(repos)} repositories...")
 
-        for repo in repos:
+        plan = plan_repos(repos, since, self.repo_filters)
+
+        if self.engine == "async":
+            from github_async import AsyncContributionFetcher
+
+            fetcher = AsyncContributionFetcher(self.github_token, self.username)
+            full = fetcher.get_contribution_metrics(
+                [(repo.full_name, scan_issues) for repo, scan_issues in plan], since
+            )
+            return {
+                "prs_merged": full["prs_merged"],
+                "prs_opened": full["prs_opened"],
+                "reviews": full["prs_reviewed"],
+                "issues": full["issues_opened"],
+                "repos": full["repos_contributed"],
+                "impact_score": full["total_impact_score"],
+            }
+
+        for repo, scan_issues in plan:
             try:
                 # PRs merged
                 for pr in repo.get_pulls(state="closed", sort="updated"):
@@ -71,10 +100,14 @@ class SimpleContributionVisualizer:
                                 metrics["reviews"] += 1
 
                 # Issues
-                for issue in repo.get_issues(state="all", sort="updated"):
-                    if issue.created_at >= since and issue.user.login == self.username:
-                        if issue.pull_request is None:
-                            metrics["issues"] += 1
+                if scan_issues:
+                    for issue in repo.get_issues(state="all", sort="updated"):
+                        if (
+                            issue.created_at >= since
+                            and issue.user.login == self.username
+                        ):
+                            if issue.pull_request is None:
+                                metrics["issues"] += 1
             except Exception:
                 continue
 
@@ -196,7 +229,13 @@ def main():
 
     print(f"Generating simple contribution card for {username}...")
 
-    visualizer = SimpleContributionVisualizer(github_token, username)
+    repo_filters = repo_filters_from_env()
+    # "async" pages through the API concurrently over keep-alive connections
+    engine = os.getenv("FETCH_ENGINE", "pygithub")
+
+    visualizer = SimpleContributionVisualizer(
+        github_token, username, repo_filters, engine
+    )
     metrics = visualizer.get_metrics(days=365)
 
     print("\n📊 Metrics:")
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Async GitHub fetch engine
+Pages through the REST endpoints used by the contribution visualizers over a
+shared keep-alive connection pool, fetching all remaining pages concurrently
+once the first response reveals the last page.
+"""
+
+import asyncio
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    print("Installing required packages...")
+    os.system(f"{sys.executable} -m pip install aiohttp --quiet")
+    import aiohttp
+
+from checkpoint import FetchCheckpoint, empty_repo_metrics, merge_repo_metrics
+from repo_filters import as_utc
+
+API_URL = "https://api.github.com"
+PER_PAGE = 100
+
+# Rate-limited requests are retried this many times, waiting at most this long
+MAX_RETRIES = 3
+MAX_RETRY_WAIT = 60
+
+LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub API timestamp into an aware UTC datetime."""
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(
+        tzinfo=timezone.utc
+    )
+
+
+def last_page(link_header: Optional[str]) -> int:
+    """Return the last page number advertised by a Link header."""
+    if not link_header:
+        return 1
+    match = LAST_PAGE_RE.search(link_header)
+    return int(match.group(1)) if match else 1
+
+
+def retry_delay(status: int, headers) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response, if retryable."""
+    if status not in (403, 429):
+        return None
+    if "Retry-After" in headers:
+        return float(headers["Retry-After"])
+    if headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+        return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+    return None
+
+
+async def gather_or_cancel(*aws):
+    """Like ``asyncio.gather``, but cancels the siblings when one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def repo_name_of(full_name: str) -> str:
+    """Short repository name from an ``owner/name`` string."""
+    return full_name.split("/")[-1]
+
+
+def login_of(item: Dict) -> Optional[str]:
+    """Author login of an API item (None for deleted users)."""
+    return (item.get("user") or {}).get("login")
+
+
+class AsyncContributionFetcher:
+    """Fetches contribution metrics with concurrent, pipelined pagination."""
+
+    def __init__(self, github_token: str, username: str, concurrency: int = 8):
+        self.github_token = github_token
+        self.username = username
+        self.concurrency = concurrency
+
+    def get_contribution_metrics(
+        self,
+        repos: List[Tuple[str, bool]],
+        since: datetime,
+        checkpoint: Optional[FetchCheckpoint] = None,
+    ) -> Dict:
+        """Fetch metrics for ``(full_name, scan_issues)`` pairs.
+
+        Returns the same dict as ``ContributionVisualizer.get_contribution_metrics``.
+        Repos already completed in ``checkpoint`` are not fetched again.
+        """
+        return asyncio.run(self._collect(repos, as_utc(since), checkpoint))
+
+    async def _collect(
+        self,
+        repos: List[Tuple[str, bool]],
+        since: datetime,
+        checkpoint: Optional[FetchCheckpoint],
+    ) -> Dict:
+        metrics = {
+            "prs_merged": 0,
+            "prs_opened": 0,
+            "prs_reviewed": 0,
+            "issues_opened": 0,
+            "issues_closed": 0,
+            "repos_contributed": set(),
+            "total_impact_score": 0,
+            "daily_activity": {},
+        }
+
+        pending = []
+        for full_name, scan_issues in repos:
+            saved = checkpoint.repo_state(full_name) if checkpoint else None
+            if saved and saved["done"]:
+                merge_repo_metrics(metrics, repo_name_of(full_name), saved["partial"])
+            else:
+                pending.append((full_name, scan_issues))
+
+        headers = {
+            "Authorization": f"token {self.github_token}",
+            "Accept": "application/vnd.github+json",
+        }
+        # One pool for every request so connections stay alive across repos
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with aiohttp.ClientSession(
+            headers=headers, connector=connector
+        ) as session:
+            results = await asyncio.gather(
+                *(
+                    self._scan_repo(session, full_name, scan_issues, since, checkpoint)
+                    for full_name, scan_issues in pending
+                ),
+                return_exceptions=True,
+            )
+
+        failed = 0
+        for (full_name, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                print(f"Error processing {full_name}: {result}")
+                failed += 1
+                continue
+            repo_metrics, error = result
+            if error:
+                print(f"Error processing {full_name}: {error}")
+                failed += 1
+            # Listings completed before a failure still count, as with PyGithub
+            merge_repo_metrics(metrics, repo_name_of(full_name), repo_metrics)
+
+        if checkpoint:
+            checkpoint.finish(failed)
+
+        metrics["total_impact_score"] = (
+            metrics["prs_merged"] * 5
+            + metrics["prs_opened"] * 3
+            + metrics["prs_reviewed"] * 2
+            + metrics["issues_opened"] * 1
+        )
+        metrics["repos_contributed"] = len(metrics["repos_contributed"])
+
+        return metrics
+
+    async def _scan_repo(
+        self,
+        session: "aiohttp.ClientSession",
+        full_name: str,
+        scan_issues: bool,
+        since: datetime,
+        checkpoint: Optional[FetchCheckpoint],
+    ) -> Tuple[Dict, Optional[Exception]]:
+        """Fetch and count one repo, checkpointing it as soon as it completes.
+
+        Returns the repo's metrics and the first listing error, if any. The
+        metrics then cover only the listings that were fetched in full.
+        """
+        data, error = await self._fetch_repo(session, full_name, scan_issues, since)
+        repo_metrics = self._tally(data, since)
+        if checkpoint and not error:
+            checkpoint.complete(full_name, repo_metrics)
+        return repo_metrics, error
+
+    async def _fetch_repo(
+        self,
+        session: "aiohttp.ClientSession",
+        full_name: str,
+        scan_issues: bool,
+        since: datetime,
+    ) -> Tuple[Dict[str, List[Dict]], Optional[Exception]]:
+        """Fetch the raw PR, review comment and issue listings for one repo.
+
+        Returns the listings that completed and the first error, if any.
+        """
+        listings = {
+            "pulls": self._get_all(
+                session,
+                f"/repos/{full_name}/pulls",
+                {"state": "all", "sort": "updated"},
+            ),
+            # Repo-wide review comments replace one request per pull request
+            "comments": self._get_all(
+                session,
+                f"/repos/{full_name}/pulls/comments",
+                {"since": since.strftime("%Y-%m-%dT%H:%M:%SZ")},
+            ),
+        }
+        if scan_issues:
+            listings["issues"] = self._get_all(
+                session,
+                f"/repos/{full_name}/issues",
+                {"state": "all", "sort": "updated"},
+            )
+
+        # Each listing cancels its own pages on failure; the others run to the end
+        results = await asyncio.gather(*listings.values(), return_exceptions=True)
+        data = {}
+        error = None
+        for key, result in zip(listings.keys(), results):
+            if isinstance(result, Exception):
+                error = error or result
+            else:
+                data[key] = result
+        return data, error
+
+    async def _get_page(
+        self, session: "aiohttp.ClientSession", path: str, params: Dict, page: int
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Fetch a single page, returning its items and Link header."""
+        query = {**params, "per_page": PER_PAGE, "page": page}
+        for attempt in range(MAX_RETRIES + 1):
+            async with self._semaphore:
+                async with session.get(API_URL + path, params=query) as response:
+                    delay = retry_delay(response.status, response.headers)
+                    if (
+                        delay is None
+                        or attempt == MAX_RETRIES
+                        or delay > MAX_RETRY_WAIT
+                    ):
+                        response.raise_for_status()
+                        return await response.json(), response.headers.get("Link")
+            # Wait outside the semaphore so other requests are not blocked
+            await asyncio.sleep(delay)
+
+    async def _get_all(
+        self, session: "aiohttp.ClientSession", path: str, params: Dict
+    ) -> List[Dict]:
+        """Fetch every page of a listing, in page order."""
+        items, link = await self._get_page(session, path, params, 1)
+        rest = await gather_or_cancel(
+            *(
+                self._get_page(session, path, params, page)
+                for page in range(2, last_page(link) + 1)
+            )
+        )
+        for page_items, _ in rest:
+            items.extend(page_items)
+        return items
+
+    def _tally(self, data: Dict, since: datetime) -> Dict:
+        """Count one repo's listings into per-repo metrics."""
+        repo_metrics = empty_repo_metrics()
+        daily = repo_metrics["daily_activity"]
+
+        for pr in data.get("pulls", []):
+            if login_of(pr) != self.username:
+                continue
+            merged_at = parse_timestamp(pr.get("merged_at"))
+            if merged_at and merged_at >= since:
+                repo_metrics["prs_merged"] += 1
+                repo_metrics["contributed"] = True
+                date_key = merged_at.date().isoformat()
+                daily[date_key] = daily.get(date_key, 0) + 5  # PR merge = 5 points
+            created_at = parse_timestamp(pr["created_at"])
+            if created_at >= since:
+                repo_metrics["prs_opened"] += 1
+                date_key = created_at.date().isoformat()
+                daily[date_key] = daily.get(date_key, 0) + 3  # PR opened = 3 points
+
+        for comment in data.get("comments", []):
+            created_at = parse_timestamp(comment["created_at"])
+            if login_of(comment) == self.username and created_at >= since:
+                repo_metrics["prs_reviewed"] += 1
+                date_key = created_at.date().isoformat()
+                daily[date_key] = daily.get(date_key, 0) + 2  # Review = 2 points
+
+        for issue in data.get("issues", []):
+            created_at = parse_timestamp(issue["created_at"])
+            if created_at < since or login_of(issue) != self.username:
+                continue
+            if "pull_request" not in issue:  # It's an issue, not a PR
+                repo_metrics["issues_opened"] += 1
+                date_key = created_at.date().isoformat()
+                daily[date_key] = daily.get(date_key, 0) + 1  # Issue = 1 point
+                if issue["state"] == "closed":
+                    repo_metrics["issues_closed"] += 1
+
+        return repo_metrics
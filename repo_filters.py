@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Repository pre-filtering
+Decides which repositories need deep PR/issue scans using only the metadata
+already present in the repository listing.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+# Listing-metadata filters applied before deep scans (see plan_repos)
+DEFAULT_REPO_FILTERS = {
+    "skip_forks": True,
+    "skip_archived": False,
+    "skip_dormant": True,
+}
+
+
+def repo_filters_from_env() -> Dict[str, bool]:
+    """Read REPO_SKIP_FORKS / REPO_SKIP_ARCHIVED / REPO_SKIP_DORMANT."""
+    return {
+        key: os.getenv(f"REPO_{key.upper()}", str(value)).lower() == "true"
+        for key, value in DEFAULT_REPO_FILTERS.items()
+    }
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Return an aware UTC datetime; naive values are taken to be UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def plan_repos(
+    repos: List, since: datetime, repo_filters: Optional[Dict] = None
+) -> List[Tuple]:
+    """Decide which repos need deep scans using listing metadata only.
+
+    Returns ``(repo, scan_issues)`` pairs. Repos that cannot have activity
+    in the window are dropped, and repos with issues disabled skip the
+    issue scan.
+    """
+    filters = {**DEFAULT_REPO_FILTERS, **(repo_filters or {})}
+    since = as_utc(since)
+
+    plan = []
+    skipped = {"forks": 0, "archived": 0, "dormant": 0}
+    for repo in repos:
+        if repo.fork and filters["skip_forks"]:
+            skipped["forks"] += 1
+            continue
+        if repo.archived and filters["skip_archived"]:
+            skipped["archived"] += 1
+            continue
+        if filters["skip_dormant"]:
+            last_activity = max(
+                (as_utc(ts) for ts in (repo.pushed_at, repo.updated_at) if ts),
+                default=None,
+            )
+            if last_activity is None or last_activity < since:
+                skipped["dormant"] += 1
+                continue
+        plan.append((repo, repo.has_issues))
+
+    if any(skipped.values()):
+        print(
+            f"Skipping {skipped['forks']} forks, {skipped['archived']} archived "
+            f"and {skipped['dormant']} dormant repositories"
+        )
+    return plan
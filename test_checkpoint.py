@@ -0,0 +1,178 @@
+"""Tests for fetch checkpoints and resumable repository scans."""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from checkpoint import FetchCheckpoint, empty_repo_metrics
+from generate_contributions import ContributionVisualizer
+
+NOW = datetime.now(timezone.utc)
+SINCE = NOW - timedelta(days=365)
+PER_PAGE = 10
+
+
+class FakePaginatedList:
+    """Minimal stand-in for PyGithub's PaginatedList."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def get_page(self, page):
+        return self.items[page * PER_PAGE : (page + 1) * PER_PAGE]
+
+
+def make_pr(number, fail_comments):
+    def get_comments():
+        if number in fail_comments:
+            raise RuntimeError(f"comments for #{number} failed")
+        return [SimpleNamespace(user=SimpleNamespace(login="me"), created_at=NOW)]
+
+    when = NOW - timedelta(days=1)
+    return SimpleNamespace(
+        number=number,
+        user=SimpleNamespace(login="me"),
+        created_at=when,
+        updated_at=when,
+        merged_at=when,
+        get_comments=get_comments,
+    )
+
+
+def make_repo(pr_count=40, fail_comments=(), has_issues=False):
+    prs = [make_pr(number, set(fail_comments)) for number in range(1, pr_count + 1)]
+    return SimpleNamespace(
+        name="repo",
+        full_name="me/repo",
+        fork=False,
+        archived=False,
+        has_issues=has_issues,
+        pushed_at=NOW,
+        updated_at=NOW,
+        get_pulls=lambda **kwargs: FakePaginatedList(prs),
+        get_issues=lambda **kwargs: FakePaginatedList([]),
+    )
+
+
+def make_visualizer(repo, checkpoint_file):
+    visualizer = ContributionVisualizer.__new__(ContributionVisualizer)
+    visualizer.username = "me"
+    visualizer.engine = "pygithub"
+    visualizer.repo_filters = None
+    visualizer.checkpoint_file = checkpoint_file
+    visualizer.checkpoint_max_age = 24
+    visualizer.github = SimpleNamespace(per_page=PER_PAGE)
+    visualizer.user = SimpleNamespace(get_repos=lambda: [repo])
+    return visualizer
+
+
+def test_new_checkpoint_starts_empty(tmp_path):
+    checkpoint = FetchCheckpoint(str(tmp_path / "state.json"), "me", 365, SINCE)
+    assert checkpoint.state["repos"] == {}
+    assert checkpoint.since == SINCE
+
+
+def test_save_and_reload(tmp_path):
+    path = str(tmp_path / "state.json")
+    checkpoint = FetchCheckpoint(path, "me", 365, SINCE)
+    checkpoint.complete("me/repo", empty_repo_metrics())
+
+    assert os.listdir(tmp_path) == ["state.json"]  # No temp file left behind
+    reloaded = FetchCheckpoint(path, "me", 365, NOW)
+    assert reloaded.repo_state("me/repo")["done"]
+    assert reloaded.since == SINCE  # Window comes from the saved run
+
+
+def test_update_saves_periodically(tmp_path):
+    path = str(tmp_path / "state.json")
+    checkpoint = FetchCheckpoint(path, "me", 365, SINCE, save_every=2)
+    checkpoint.update("me/repo", "prs_opened", 1, empty_repo_metrics())
+    assert not os.path.exists(path)
+    checkpoint.update("me/repo", "prs_opened", 2, empty_repo_metrics())
+    with open(path) as f:
+        assert json.load(f)["repos"]["me/repo"]["page"] == 2
+
+
+def test_update_stores_a_copy(tmp_path):
+    checkpoint = FetchCheckpoint(str(tmp_path / "state.json"), "me", 365, SINCE)
+    partial = empty_repo_metrics()
+    checkpoint.update("me/repo", "prs_opened", 1, partial)
+    partial["prs_opened"] += 1
+    assert checkpoint.repo_state("me/repo")["partial"]["prs_opened"] == 0
+
+
+def test_other_run_is_not_resumed(tmp_path):
+    path = str(tmp_path / "state.json")
+    FetchCheckpoint(path, "me", 365, SINCE).complete("me/repo", empty_repo_metrics())
+    assert FetchCheckpoint(path, "someone", 365, NOW).repo_state("me/repo") is None
+    assert FetchCheckpoint(path, "me", 30, NOW).repo_state("me/repo") is None
+
+
+def test_expired_checkpoint_is_discarded(tmp_path):
+    path = str(tmp_path / "state.json")
+    checkpoint = FetchCheckpoint(path, "me", 365, SINCE)
+    checkpoint.state["created"] = (NOW - timedelta(hours=25)).isoformat()
+    checkpoint.complete("me/repo", empty_repo_metrics())
+
+    reloaded = FetchCheckpoint(path, "me", 365, NOW, max_age_hours=24)
+    assert reloaded.repo_state("me/repo") is None
+    assert reloaded.since == NOW
+
+
+def test_unreadable_checkpoint_is_ignored(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("not json")
+    assert FetchCheckpoint(str(path), "me", 365, SINCE).state["repos"] == {}
+
+
+def test_finish(tmp_path):
+    path = str(tmp_path / "state.json")
+    checkpoint = FetchCheckpoint(path, "me", 365, SINCE)
+    checkpoint.finish(1)
+    assert os.path.exists(path)  # Kept so failed repos are retried
+    checkpoint.finish(0)
+    assert not os.path.exists(path)
+
+
+def test_resume_after_failure_matches_clean_run(tmp_path):
+    path = str(tmp_path / "state.json")
+    failing = make_visualizer(make_repo(fail_comments=[35]), path)
+    partial = failing.get_contribution_metrics()
+    assert partial["prs_reviewed"] == 34
+    assert os.path.exists(path)
+
+    resumed = make_visualizer(make_repo(), path).get_contribution_metrics()
+    clean = make_visualizer(make_repo(), None).get_contribution_metrics()
+    assert resumed == clean
+    assert resumed["prs_reviewed"] == 40
+    assert not os.path.exists(path)
+
+
+def test_repeated_mid_page_failures_do_not_grow_counts(tmp_path):
+    path = str(tmp_path / "state.json")
+    runs = [
+        make_visualizer(make_repo(fail_comments=[35]), path).get_contribution_metrics()
+        for _ in range(3)
+    ]
+    assert [run["prs_reviewed"] for run in runs] == [34, 34, 34]
+    assert runs[0] == runs[1] == runs[2]
+
+    saved = FetchCheckpoint(path, "me", 365, SINCE).repo_state("me/repo")
+    assert (saved["stage"], saved["page"]) == ("prs_reviewed", 3)
+    assert saved["partial"]["prs_reviewed"] == 30
+
+
+def test_unknown_saved_stage_rescans_repo(tmp_path):
+    path = str(tmp_path / "state.json")
+    checkpoint = FetchCheckpoint(path, "me", 365, SINCE)
+    stale = empty_repo_metrics()
+    stale["issues_opened"] = 99
+    checkpoint.update("me/repo", "issues_opened", 1, stale)
+    checkpoint.save()
+
+    # Issues are disabled now, so the saved issues cursor cannot be used
+    metrics = make_visualizer(make_repo(), path).get_contribution_metrics()
+    clean = make_visualizer(make_repo(), None).get_contribution_metrics()
+    assert metrics == clean
+    assert metrics["issues_opened"] == 0
@@ -0,0 +1,122 @@
+"""Tests for the pure helpers of the async fetch engine."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import github_async  # noqa: E402
+from github_async import (  # noqa: E402
+    AsyncContributionFetcher,
+    last_page,
+    parse_timestamp,
+    retry_delay,
+)
+
+SINCE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("2025-03-04T05:06:07Z") == datetime(
+        2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc
+    )
+    assert parse_timestamp(None) is None
+
+
+def test_last_page():
+    link = (
+        '<https://api.github.com/repos/o/r/pulls?page=2>; rel="next", '
+        '<https://api.github.com/repos/o/r/pulls?page=7>; rel="last"'
+    )
+    assert last_page(link) == 7
+
+
+def test_last_page_with_per_page_before_page():
+    link = (
+        '<https://api.github.com/repos/o/r/pulls?per_page=100&state=all&page=2>; '
+        'rel="next", '
+        '<https://api.github.com/repos/o/r/pulls?per_page=100&state=all&page=12>; '
+        'rel="last"'
+    )
+    assert last_page(link) == 12
+
+
+def test_last_page_without_last_link():
+    assert last_page(None) == 1
+    assert last_page('<https://api.github.com/x?page=1>; rel="prev"') == 1
+
+
+def test_retry_delay_uses_retry_after():
+    assert retry_delay(429, {"Retry-After": "5"}) == 5.0
+    assert retry_delay(403, {"Retry-After": "2"}) == 2.0
+
+
+def test_retry_delay_uses_rate_limit_reset(monkeypatch):
+    monkeypatch.setattr(github_async.time, "time", lambda: 1000.0)
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+    assert retry_delay(403, headers) == 30.0
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "900"}
+    assert retry_delay(403, headers) == 0.0
+
+
+def test_retry_delay_not_retryable():
+    assert retry_delay(500, {"Retry-After": "5"}) is None
+    assert retry_delay(404, {}) is None
+    # A plain 403 (e.g. missing permission) is not a rate limit
+    assert retry_delay(403, {"X-RateLimit-Remaining": "10"}) is None
+
+
+def test_tally():
+    me = {"login": "me"}
+    other = {"login": "other"}
+    data = {
+        "pulls": [
+            {
+                "user": me,
+                "created_at": "2025-02-01T10:00:00Z",
+                "merged_at": "2025-02-03T10:00:00Z",
+            },
+            {"user": me, "created_at": "2024-06-01T10:00:00Z", "merged_at": None},
+            {"user": other, "created_at": "2025-02-01T10:00:00Z", "merged_at": None},
+            {"user": None, "created_at": "2025-02-01T10:00:00Z", "merged_at": None},
+        ],
+        "comments": [
+            {"user": me, "created_at": "2025-02-02T10:00:00Z"},
+            {"user": me, "created_at": "2024-12-31T23:59:59Z"},
+            {"user": other, "created_at": "2025-02-02T10:00:00Z"},
+        ],
+        "issues": [
+            {"user": me, "created_at": "2025-02-04T10:00:00Z", "state": "closed"},
+            {"user": me, "created_at": "2025-02-04T10:00:00Z", "state": "open"},
+            {
+                "user": me,
+                "created_at": "2025-02-04T10:00:00Z",
+                "state": "open",
+                "pull_request": {},
+            },
+        ],
+    }
+
+    metrics = AsyncContributionFetcher("token", "me")._tally(data, SINCE)
+
+    assert metrics == {
+        "prs_merged": 1,
+        "prs_opened": 1,
+        "prs_reviewed": 1,
+        "issues_opened": 2,
+        "issues_closed": 1,
+        "contributed": True,
+        "daily_activity": {
+            "2025-02-01": 3,
+            "2025-02-02": 2,
+            "2025-02-03": 5,
+            "2025-02-04": 2,
+        },
+    }
+
+
+def test_tally_with_missing_listings():
+    metrics = AsyncContributionFetcher("token", "me")._tally({}, SINCE)
+    assert metrics["prs_opened"] == 0
+    assert not metrics["contributed"]
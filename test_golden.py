@@ -0,0 +1,23 @@
+"""Golden-output check for every SVG renderer (timings: benchmark_render.py)."""
+
+import os
+
+import pytest
+
+from benchmark_render import GOLDEN_DIR, build_cases
+
+CASES = build_cases()
+
+
+@pytest.mark.parametrize("name,render", CASES, ids=[name for name, _ in CASES])
+def test_render_matches_golden(name, render):
+    with open(os.path.join(GOLDEN_DIR, f"{name}.svg")) as f:
+        assert render() == f.read(), (
+            f"{name} differs from golden output; "
+            "run `python benchmark_render.py --update` if the change is intended"
+        )
+
+
+def test_every_golden_file_has_a_case():
+    names = {f"{name}.svg" for name, _ in CASES}
+    assert set(os.listdir(GOLDEN_DIR)) == names
@@ -0,0 +1,53 @@
+"""Tests for listing-metadata repository filtering."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from repo_filters import plan_repos
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+SINCE = NOW - timedelta(days=365)
+
+
+def make_repo(name, pushed_at, updated_at=None, **overrides):
+    fields = {
+        "name": name,
+        "fork": False,
+        "archived": False,
+        "has_issues": True,
+        "pushed_at": pushed_at,
+        "updated_at": updated_at,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_aware_timestamps_against_aware_since():
+    # PyGithub 2.x returns timezone-aware datetimes
+    active = make_repo("active", NOW - timedelta(days=3))
+    dormant = make_repo("dormant", NOW - timedelta(days=900))
+    plan = plan_repos([active, dormant], SINCE)
+    assert [repo.name for repo, _ in plan] == ["active"]
+
+
+def test_mixed_naive_and_aware_timestamps():
+    naive_since = SINCE.replace(tzinfo=None)
+    repo = make_repo(
+        "mixed",
+        NOW - timedelta(days=900),
+        updated_at=(NOW - timedelta(days=1)).replace(tzinfo=None),
+    )
+    assert [r.name for r, _ in plan_repos([repo], naive_since)] == ["mixed"]
+    assert [r.name for r, _ in plan_repos([repo], SINCE)] == ["mixed"]
+
+
+def test_filters_and_issue_scan(capsys):
+    repos = [
+        make_repo("fork", NOW, fork=True),
+        make_repo("archived", NOW, archived=True),
+        make_repo("no-issues", NOW, has_issues=False),
+        make_repo("empty", None),
+    ]
+    plan = plan_repos(repos, SINCE, {"skip_archived": True})
+    assert [(repo.name, scan) for repo, scan in plan] == [("no-issues", False)]
+    assert "1 forks, 1 archived and 1 dormant" in capsys.readouterr().out